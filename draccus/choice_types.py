@@ -35,10 +35,22 @@ We may add support for Unions.
 All registered types must be *dataclasses*
 """
 
+import dataclasses
 import functools
-import importlib
-import pkgutil
-from typing import Any, Callable, ClassVar, Dict, Optional, Protocol, Type, TypeVar, overload, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+    runtime_checkable,
+)
 
 T = TypeVar("T")
 
@@ -46,6 +58,14 @@ T = TypeVar("T")
 CHOICE_TYPE_KEY = "type"
 """name of key to use in configuration to specify the type of a choice type"""
 
+_discovered_plugin_modules: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+"""
+cache of the plugin module names found under each PluginRegistry.discover_packages_path, keyed by the path and the
+package's (possibly dynamic, for namespace packages) `__path__`. It is never cleared: new plugin modules on an
+already-scanned directory aren't picked up by registries created afterwards, but new `__path__` entries
+(e.g. after a sys.path change) are.
+"""
+
 
 @runtime_checkable
 class ChoiceType(Protocol):
@@ -72,6 +92,7 @@ class ChoiceType(Protocol):
 
 class ChoiceRegistryBase(ChoiceType):
     _choice_registry: ClassVar[Dict[str, Any]]
+    _choice_name_by_cls: ClassVar[Dict[Type, str]]
 
     @classmethod
     def get_choice_class(cls, name: str) -> Any:
@@ -83,8 +104,15 @@ class ChoiceRegistryBase(ChoiceType):
 
     @classmethod
     def get_choice_name(cls, subcls: Type) -> str:
+        try:
+            return cls._choice_name_by_cls[subcls]
+        except KeyError:
+            pass
+
+        # entries added to _choice_registry directly (not through register_subclass) aren't in the reverse map yet
         for name, choice_type in cls._choice_registry.items():
             if choice_type == subcls:
+                cls._choice_name_by_cls[subcls] = name
                 return name
         raise ValueError(f"Cannot find choice name for {subcls}")
 
@@ -114,16 +142,46 @@ class ChoiceRegistryBase(ChoiceType):
                 )
 
         cls._choice_registry[name] = choice_type
+        # keep the first name a class was registered under, matching lookup order in _choice_registry
+        cls._choice_name_by_cls.setdefault(choice_type, name)
+        _warm_decoding_cache(choice_type)
         return choice_type
 
+    @classmethod
+    def _is_registered_choice(cls) -> bool:
+        """
+        Returns whether cls is itself one of the registered choices, without raising like get_choice_name(cls).
+        Like get_choice_name, this doesn't trigger plugin discovery.
+        """
+        if cls.get_choice_name.__func__ is not ChoiceRegistryBase.get_choice_name.__func__:  # type: ignore
+            # honour an overridden get_choice_name
+            try:
+                cls.get_choice_name(cls)
+            except ValueError:
+                return False
+            return True
+
+        return cls in cls._choice_name_by_cls
+
+    @classmethod
+    def _init_choice_names(cls) -> None:
+        """Creates the reverse {class: name} map for a class that owns its own _choice_registry."""
+        if "_choice_registry" in cls.__dict__ and "_choice_name_by_cls" not in cls.__dict__:
+            # the registry may have been declared in the class body with entries already in it
+            cls._choice_name_by_cls = {}
+            for name, choice_type in cls._choice_registry.items():
+                cls._choice_name_by_cls.setdefault(choice_type, name)
+
 
 class ChoiceRegistry(ChoiceRegistryBase):
     _choice_registry: ClassVar[Dict[str, Any]]
+    _choice_name_by_cls: ClassVar[Dict[Type, str]]
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         if not hasattr(cls, "_choice_registry"):
             cls._choice_registry: ClassVar[Dict[str, Any]] = {}
+        cls._init_choice_names()
 
 
 class PluginRegistry(ChoiceRegistryBase):
@@ -166,6 +224,7 @@ class PluginRegistry(ChoiceRegistryBase):
 
     # TODO: is it better to lazily import plugins?
     _choice_registry: ClassVar[Dict[str, Any]]
+    _choice_name_by_cls: ClassVar[Dict[Type, str]]
     discover_packages_path: ClassVar[str]
     _did_discover_packages: ClassVar[bool]
 
@@ -173,6 +232,7 @@ class PluginRegistry(ChoiceRegistryBase):
         super().__init_subclass__(**kwargs)
         if not hasattr(cls, "_choice_registry"):
             cls._choice_registry = {}
+        cls._init_choice_names()
         if not hasattr(cls, "discover_packages_path"):
             if discover_packages_path is None:
                 raise ValueError("discover_packages_path must be specified in the class or constructor")
@@ -181,12 +241,15 @@ class PluginRegistry(ChoiceRegistryBase):
 
     @classmethod
     def get_choice_class(cls, name: str) -> Any:
-        cls._discover_packages()
+        # check the flag inline: these are called on every parse, and discovery only ever runs once
+        if not cls._did_discover_packages:
+            cls._discover_packages()
         return cls._choice_registry[name]
 
     @classmethod
     def get_known_choices(cls) -> Dict[str, Any]:
-        cls._discover_packages()
+        if not cls._did_discover_packages:
+            cls._discover_packages()
         return cls._choice_registry
 
     @classmethod
@@ -194,18 +257,54 @@ class PluginRegistry(ChoiceRegistryBase):
         if cls._did_discover_packages:
             return
 
+        # imported here rather than at module level: only plugin discovery needs them, and pkgutil isn't otherwise
+        # loaded by `import draccus`
+        import importlib
+        import pkgutil
+
         # from https://packaging.python.org/en/latest/guides/creating-and-discovering-plugins/
         package_module = importlib.import_module(cls.discover_packages_path, __package__)
 
-        def iter_namespace(ns_pkg):
-            # Specifying the second argument (prefix) to iter_modules makes the
-            # returned name an absolute name instead of a relative one. This allows
-            # import_module to work without having to do additional modification to
-            # the name.
-            return pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + ".")
+        # every subclass of a registry (including the registered choices themselves) discovers separately, usually
+        # with the same path, so only scan the package directories once per path
+        cache_key = (cls.discover_packages_path, tuple(package_module.__path__))
+        pkg_names = _discovered_plugin_modules.get(cache_key)
+        if pkg_names is None:
+
+            def iter_namespace(ns_pkg):
+                # Specifying the second argument (prefix) to iter_modules makes the
+                # returned name an absolute name instead of a relative one. This allows
+                # import_module to work without having to do additional modification to
+                # the name.
+                return pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + ".")
+
+            pkg_names = [pkg_name for _finder, pkg_name, _ispkg in iter_namespace(package_module)]
+            _discovered_plugin_modules[cache_key] = pkg_names
 
-        for _finder, pkg_name, _ispkg in iter_namespace(package_module):
+        for pkg_name in pkg_names:
             importlib.import_module(pkg_name)
             # registration should happen in the initialization of the package, so importing is sufficient
 
         cls._did_discover_packages = True
+
+
+def _warm_decoding_cache(choice_type: Type) -> None:
+    """
+    Resolves the field types of a newly registered choice, so the first decode (typically the latency-sensitive
+    first CLI parse) doesn't pay for it. This is best-effort: if the annotations can't be resolved yet
+    (e.g. forward references), the cache is simply filled on first decode instead.
+
+    NOTE: this shares the LRU cache of `get_field_types`, which is bounded generously (1024 classes) so that
+    registration-time warming for plugin-heavy registries doesn't evict the entries of types actually being decoded.
+    """
+    # deferred to avoid an import cycle: draccus.parsers.decoding imports this module
+    from draccus.parsers.decoding import get_field_types
+
+    if not dataclasses.is_dataclass(choice_type):
+        return
+
+    try:
+        get_field_types(choice_type)
+    except (NameError, TypeError):
+        # unresolvable (e.g. forward) references: failures aren't cached, so the first decode will retry
+        pass
@@ -122,13 +122,15 @@ def is_generic_type(cls: Type[Any]) -> bool:
     return typing.get_origin(cls) is not None
 
 
-def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str] = ()) -> Dataclass:
-    path = tuple(path)
-    obj_dict: Dict[str, Any] = d.copy()
-    init_args: Dict[str, Any] = {}
-    non_init_args: Dict[str, Any] = {}
-    logger.debug(f"from_dict for {cls}")
-
+@lru_cache(maxsize=1024)
+def get_field_types(cls: Type[Dataclass]) -> Dict[str, Any]:
+    """Resolves the type hints of a (possibly parameterized) dataclass, substituting any bound type arguments.
+
+    NOTE: `typing.get_type_hints` re-evaluates every annotation on each call, which dominates the cost of
+    decoding small dataclasses (e.g. the subclasses of a choice type). The result is cached per class, so callers
+    must not mutate the returned dict. The cache is also filled for every choice at registration time (see
+    `draccus.choice_types._warm_decoding_cache`), so it is bounded generously.
+    """
     origin = typing.get_origin(cls)
     if origin is not None:
         type_args = typing.get_args(cls)
@@ -138,7 +140,18 @@ def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str
         origin = cls
         type_map = {}
 
-    hints = {name: apply_type_map(t, type_map) for name, t in typing.get_type_hints(origin).items()}
+    return {name: apply_type_map(t, type_map) for name, t in typing.get_type_hints(origin).items()}
+
+
+def decode_dataclass(cls: Type[Dataclass], d: Dict[str, Any], path: Sequence[str] = ()) -> Dataclass:
+    path = tuple(path)
+    obj_dict: Dict[str, Any] = d.copy()
+    init_args: Dict[str, Any] = {}
+    non_init_args: Dict[str, Any] = {}
+    logger.debug(f"from_dict for {cls}")
+
+    origin = typing.get_origin(cls) or cls
+    hints = get_field_types(cls)
 
     for field in fields(origin):
         name = field.name
@@ -187,12 +200,19 @@ def decode_choice_class(cls: Type[T], raw_value: Any, path: Sequence[str]) -> T:
     """Decodes a value into an subtype of a choice class following the ChoiceType protocol."""
     assert issubclass(cls, ChoiceType)
 
-    try:
-        cls.get_choice_name(cls)
-        # we already know what type we're looking for, so we can just use that
-        return decode_dataclass(cls, raw_value)  # type: ignore
-    except ValueError:
-        pass
+    # if cls is itself one of the choices, we already know what type we're looking for, so we can just use that.
+    # (checking membership avoids raising and discarding a ValueError from get_choice_name on every decode)
+    is_registered_choice = getattr(cls, "_is_registered_choice", None)
+    if is_registered_choice is not None:
+        # registries can answer this from their reverse {class: name} map
+        is_registered = is_registered_choice()
+    else:
+        # structural ChoiceTypes only promise get_known_choices, so we have to scan its values. (Calling it here,
+        # before the membership test, also matters: for plugin-style choice types it's what triggers discovery.)
+        is_registered = cls in cls.get_known_choices().values()
+
+    if is_registered:
+        return decode_dataclass(cls, raw_value, path)  # type: ignore
 
     if not isinstance(raw_value, dict):
         raise ParsingError(f"Expected a dict for a choice class, got {raw_value}")
@@ -209,11 +229,17 @@ def decode_choice_class(cls: Type[T], raw_value: Any, path: Sequence[str]) -> T:
     try:
         subcls = cls.get_choice_class(choice_type)
     except KeyError as e:
-        raise DecodingError(path, f"Couldn't find a choice class for '{choice_type}' in {cls}") from e
-
-    raw_value = raw_value.copy()
+        # only fetched on failure, so the success path does a single (discovery-guarded) lookup
+        known_choices = cls.get_known_choices()
+        raise DecodingError(
+            path,
+            f"Couldn't find a choice class for '{choice_type}' in {cls}. Expected one of {list(known_choices.keys())}",
+        ) from e
+
+    # decode_dataclass makes its own copy, so we only need one here if there's a key to strip
     if CHOICE_TYPE_KEY in raw_value:
-        raw_value.pop(CHOICE_TYPE_KEY)
+        raw_value = raw_value.copy()
+        del raw_value[CHOICE_TYPE_KEY]
 
     # return decode(subcls, raw_value)
     return decode_dataclass(subcls, raw_value, path)
@@ -14,6 +14,7 @@ import sys
 import types
 from dataclasses import _MISSING_TYPE
 from enum import Enum
+from functools import lru_cache
 from logging import getLogger
 from typing import (
     Any,
@@ -385,14 +386,21 @@ def is_choice_type(cls: Any) -> bool:
     OR
     2) cls structurally matches the ChoiceType protocol, but none of its parents do
     """
-    from draccus.choice_types import ChoiceRegistry, ChoiceType, PluginRegistry
-
-    CHOICE_BASES = (ChoiceRegistry, PluginRegistry, ChoiceType)
-
     # Skip if not a proper class
     if not isinstance(cls, type):
         return False
 
+    return _is_choice_class(cls)
+
+
+# This is called on every encode. A class's answer never changes, so we cache it: this skips the function-local
+# import and the repeated base checks below (the ChoiceType issubclass checks themselves are cached by ABCMeta).
+@lru_cache(maxsize=100)
+def _is_choice_class(cls: type) -> bool:
+    from draccus.choice_types import ChoiceRegistry, ChoiceType, PluginRegistry
+
+    CHOICE_BASES = (ChoiceRegistry, PluginRegistry, ChoiceType)
+
     # 1. does not structurally match protocol --> False
     try:
         if not issubclass(cls, ChoiceType):
@@ -0,0 +1,11 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+
+from draccus.choice_types import PluginRegistry
+
+
+@dataclasses.dataclass(frozen=True)
+class OptimizerConfig(PluginRegistry, discover_packages_path="tests.draccus_choice_plugins"):
+    lr: float = 1e-3
@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
+
+import dataclasses
+
+from tests.draccus_choice_plugins.optimizer_config import OptimizerConfig
+
+
+@OptimizerConfig.register_subclass("sgd")
+@dataclasses.dataclass(frozen=True)
+class SgdConfig(OptimizerConfig):
+    momentum: float = 0.9
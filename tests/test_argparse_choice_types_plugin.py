@@ -42,6 +42,22 @@ def test_plugin_registry_argparse():
         Something.setup("--model.attn_pdrop 12")
 
 
+def test_plugin_registries_sharing_a_path():
+    from draccus.choice_types import _discovered_plugin_modules
+
+    from .draccus_choice_plugins.gpt import GptConfig
+    from .draccus_choice_plugins.optimizer_config import OptimizerConfig
+    from .draccus_choice_plugins.sgd import SgdConfig
+
+    # both registries discover from tests.draccus_choice_plugins, which is only scanned once
+    assert ModelConfig.get_known_choices() == {"mlp": MlpConfig, "gpt": GptConfig}
+    assert OptimizerConfig.get_known_choices() == {"sgd": SgdConfig}
+    # as do registered choices, which are themselves registry subclasses
+    assert MlpConfig.get_known_choices() is ModelConfig.get_known_choices()
+
+    assert [path for path, _ in _discovered_plugin_modules].count("tests.draccus_choice_plugins") == 1
+
+
 # skip this test if using python 3.8
 # the help text is a bit different in 3.8
 
@@ -2,6 +2,7 @@
 # Copyright 2025 The Board of Trustees of the Leland Stanford Junior University
 
 import dataclasses
+from typing import Any, ClassVar, Dict, Optional, Type
 
 import pytest
 
@@ -60,3 +61,197 @@ def test_is_choicetype():
     assert draccus.utils.is_choice_type(Person)
     assert not draccus.utils.is_choice_type(Adult)
     assert not draccus.utils.is_choice_type(Child)
+
+
+def test_choice_registry_get_choice_name():
+    assert Person.get_choice_name(Adult) == "adult"
+    assert Person.get_choice_name(Child) == "child"
+
+    with pytest.raises(ValueError):
+        Person.get_choice_name(Person)
+
+
+@dataclasses.dataclass
+class Animal(ChoiceRegistry):
+    name: str
+
+
+@dataclasses.dataclass
+class Dog(Animal):
+    breed: str = "mutt"
+
+
+Animal.register_subclass("animal", Animal)
+Animal.register_subclass("dog", Dog)
+
+
+def test_choice_registry_decode_registered_base():
+    assert draccus.decode(Animal, {"name": "rex"}) == Animal("rex")
+
+    with pytest.raises(DecodingError):
+        draccus.decode(Animal, {"name": "rex", "breed": "lab"})
+
+
+def test_choice_registry_get_choice_name_multiple_names():
+    @dataclasses.dataclass
+    class Vehicle(ChoiceRegistry):
+        wheels: int = 4
+
+    @dataclasses.dataclass
+    class Car(Vehicle):
+        pass
+
+    Vehicle.register_subclass("car", Car)
+    Vehicle.register_subclass("automobile", Car)
+
+    assert Vehicle.get_choice_name(Car) == "car"
+    assert Vehicle.get_choice_class("automobile") is Car
+
+
+def test_choice_registry_decode_unknown_type_lists_choices():
+    with pytest.raises(DecodingError, match=r"Expected one of \['adult', 'child'\]"):
+        draccus.decode(Person, {"type": "baby", "name": "bob"})
+
+
+@dataclasses.dataclass
+class Optim:
+    """Implements the ChoiceType protocol structurally, with case-insensitive names."""
+
+    lr: float = 0.1
+
+    @classmethod
+    def get_choice_class(cls, name: str) -> Any:
+        return cls.get_known_choices()[name.lower()]
+
+    @classmethod
+    def get_known_choices(cls) -> Dict[str, Any]:
+        return {"adam": Adam}
+
+    @classmethod
+    def get_choice_name(cls, subcls: Type) -> str:
+        for name, choice_type in cls.get_known_choices().items():
+            if choice_type is subcls:
+                return name
+        raise ValueError(f"Cannot find choice name for {subcls}")
+
+    @classmethod
+    def default_choice_name(cls) -> Optional[str]:
+        return None
+
+
+@dataclasses.dataclass
+class Adam(Optim):
+    beta: float = 0.9
+
+
+def test_structural_choice_type_decode():
+    assert draccus.utils.is_choice_type(Optim)
+    assert draccus.decode(Optim, {"type": "adam", "lr": 0.2}) == Adam(lr=0.2)
+    # names are resolved through get_choice_class, so it may accept names get_known_choices doesn't list
+    assert draccus.decode(Optim, {"type": "ADAM"}) == Adam(lr=0.1)
+
+
+def test_choice_registry_predeclared_registry():
+    @dataclasses.dataclass
+    class Shape(ChoiceRegistry):
+        _choice_registry: ClassVar[Dict[str, Any]] = {}
+
+    @dataclasses.dataclass
+    class Square(Shape):
+        side: int = 1
+
+    @dataclasses.dataclass
+    class Circle(Shape):
+        radius: int = 1
+
+    Shape.register_subclass("square", Square)
+    assert Shape.get_choice_name(Square) == "square"
+
+    # entries added without register_subclass are still found
+    Shape._choice_registry["circle"] = Circle
+    assert Shape.get_choice_name(Circle) == "circle"
+    assert draccus.encode(Circle(2), Shape) == {"type": "circle", "radius": 2}
+
+
+@dataclasses.dataclass
+class Plant(ChoiceRegistry):
+    height: int = 1
+
+    @classmethod
+    def get_choice_name(cls, subcls: Type) -> str:
+        # every plant decodes as itself
+        return "plant"
+
+
+@dataclasses.dataclass
+class Tree(Plant):
+    rings: int = 0
+
+
+Plant.register_subclass("tree", Tree)
+
+
+def test_choice_registry_decode_overridden_get_choice_name():
+    assert draccus.decode(Plant, {"height": 3}) == Plant(3)
+
+
+@dataclasses.dataclass
+class Garden(ChoiceRegistry):
+    pass
+
+
+@dataclasses.dataclass
+class RoseGarden(Garden):
+    rose: "Rose"  # not defined until after registration
+
+
+Garden.register_subclass("roses", RoseGarden)
+
+
+@dataclasses.dataclass
+class Rose:
+    color: str = "red"
+
+
+def test_register_subclass_warms_field_types():
+    from draccus.parsers.decoding import get_field_types
+
+    @dataclasses.dataclass
+    class Fruit(ChoiceRegistry):
+        pass
+
+    @dataclasses.dataclass
+    class Apple(Fruit):
+        sweet: bool = True
+
+    Fruit.register_subclass("apple", Apple)
+
+    before = get_field_types.cache_info()
+    assert draccus.decode(Fruit, {"type": "apple", "sweet": "false"}) == Apple(False)
+    after = get_field_types.cache_info()
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+
+
+def test_register_subclass_warming_retries_forward_refs():
+    from draccus.parsers.decoding import get_field_types
+
+    # the warm-up at registration failed on the forward reference, so the first decode resolves it
+    assert draccus.decode(Garden, {"type": "roses", "rose": {"color": "white"}}) == RoseGarden(Rose("white"))
+
+    # ...and caches it from then on
+    before = get_field_types.cache_info()
+    assert get_field_types(RoseGarden)["rose"] is Rose
+    assert get_field_types.cache_info().hits == before.hits + 1
+
+
+def test_is_choicetype_cached():
+    # asking repeatedly goes through the cache, and must keep giving the same answers
+    for _ in range(2):
+        assert draccus.utils.is_choice_type(Person)
+        assert not draccus.utils.is_choice_type(Adult)
+        assert draccus.utils.is_choice_type(Optim)
+        assert not draccus.utils.is_choice_type(Adam)
+        assert not draccus.utils.is_choice_type(Rose)
+
+    assert draccus.utils._is_choice_class.cache_info().hits > 0
@@ -33,3 +33,18 @@ def test_generic_params():
     list_decoded = draccus.decode(List[ScheduleStep[int]], [{"until": 10, "value": 1}])
 
     assert list_decoded == [ScheduleStep(until=10, value=1)]
+
+
+def test_generic_params_cached_per_alias():
+    from draccus.parsers.decoding import get_field_types
+
+    int_step = draccus.decode(ScheduleStep[int], {"until": 10, "value": "3"})
+    str_step = draccus.decode(ScheduleStep[str], {"until": 10, "value": "3"})
+
+    assert int_step == ScheduleStep(until=10, value=3)
+    assert str_step == ScheduleStep(until=10, value="3")
+
+    assert get_field_types(ScheduleStep[int])["value"] is int
+    assert get_field_types(ScheduleStep[str])["value"] is str
+    # decoding again goes through the cache and still uses the right type map
+    assert draccus.decode(ScheduleStep[int], {"until": 1, "value": "4"}).value == 4